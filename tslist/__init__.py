@@ -43,6 +43,6 @@ from .tsdiff import TSDiff  # noqa F401 E402
 from .tsobj import TSObject  # noqa F401 E402
 from .tslist import TSList  # noqa F401 E402
 from .tsdict import TSDict  # noqa F401 E402
-from .tsdir import TSDir, NOW  # noqa F401 E402
+from .tsdir import TSDir, TSLogDir, NOW  # noqa F401 E402
 from .api import api  # noqa F401 E402
 from .tsclient import TSClient  # noqa F401 E402
@@ -1,9 +1,18 @@
 import sys
+from functools import lru_cache
 from urllib.parse import unquote_plus
 
 from .tsdir import TSDir
 
 
+def _unquote(s):
+    # query args come url-decoded already, but older clients
+    # quoted values twice (so escapes remain after decoding)
+    if s and '%' in s:
+        return unquote_plus(s)
+    return s
+
+
 def api(tsdir: TSDir = '.', *tokens):
     try:
         from flask import Flask, make_response, request
@@ -17,6 +26,10 @@ def api(tsdir: TSDir = '.', *tokens):
 
     app = Flask('Delta')
 
+    @lru_cache(maxsize=256)
+    def sub_dir(sub_path):
+        return tsdir(unquote_plus(sub_path))
+
     @app.route("/")
     @app.route('/<path:sub_path>')
     def return_items(sub_path=''):
@@ -24,7 +37,7 @@ def api(tsdir: TSDir = '.', *tokens):
             if request.args.get('token') not in tokens:
                 return make_response('Unauthorized token', 401)
 
-        tbl = tsdir(unquote_plus(sub_path))
+        tbl = sub_dir(sub_path)
 
         item = request.args.get('item', request.args.get('date'))
         if item is not None:
@@ -33,16 +46,14 @@ def api(tsdir: TSDir = '.', *tokens):
             elif item.isdigit():
                 item = int(item)
             else:
-                item = unquote_plus(item)
+                item = _unquote(item)
             return tbl[item]
 
         start = request.args.get('start')
         stop = request.args.get('stop', request.args.get('end'))
         step = request.args.get('step')
 
-        start = unquote_plus(start) if start else start
-        stop = unquote_plus(stop) if stop else stop
-        step = unquote_plus(step) if step else step
+        start, stop, step = _unquote(start), _unquote(stop), _unquote(step)
         return tbl[start:stop:step]
 
     @app.route('/subdir')
@@ -53,7 +64,7 @@ def api(tsdir: TSDir = '.', *tokens):
         if tokens:
             if request.args.get('token') not in tokens:
                 return make_response('Unauthorized token', 401)
-        tbl = tsdir(unquote_plus(sub_path))
+        tbl = sub_dir(sub_path)
         return [s.name for s in tbl.subdir()]
 
     @app.route('/tree')
@@ -62,7 +73,7 @@ def api(tsdir: TSDir = '.', *tokens):
         if tokens:
             if request.args.get('token') not in tokens:
                 return make_response('Unauthorized token', 401)
-        tbl = tsdir(unquote_plus(sub_path))
+        tbl = sub_dir(sub_path)
         s = tbl.tree(print=False, limit=request.args.get('limit', 1_000))
         response = make_response(s, 200)
         response.mimetype = "text/plain"
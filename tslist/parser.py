@@ -10,10 +10,20 @@
 # License:  Apache License 2.0 (see LICENSE file)
 
 
+import re
+from functools import lru_cache
+from string import whitespace
 from warnings import warn
 
 from datetime import date, datetime, timedelta
 
+_DATE_RE = re.compile(
+    r'(?P<y1>\d{4})-(?P<m1>\d{1,2})-(?P<d1>\d{1,2})'
+    r'|(?P<d2>\d{1,2})\.(?P<m2>\d{1,2})\.(?P<y2>\d{4})'
+    r'|(?P<m3>\d{1,2})/(?P<d3>\d{1,2})/(?P<y3>\d{4})'
+    r'|(?P<y4>\d{4})(?P<m4>\d{2})(?P<d4>\d{2})'
+)
+
 try:
     from dateutil.parser import parse
 except ImportError:
@@ -22,17 +32,51 @@ except ImportError:
                "for more flexible datetime parsing")
         warn(msg)
         date_str = str(date_str)
-        if date_str.count('-'):
-            str_format = '%Y-%m-%d'
-        elif date_str.count('.'):
-            str_format = '%d.%m.%Y'
-        elif date_str.count('/'):
-            str_format = '%m/%d/%Y'
-        elif len(date_str) == 8 and date_str.isdigit():
-            str_format = '%Y%m%d'
-        else:
+        match = _DATE_RE.fullmatch(date_str)
+        if match is None:
             return datetime.fromisoformat(date_str)
-        return datetime.strptime(date_str, str_format)
+        g = match.groupdict()
+        year = g['y1'] or g['y2'] or g['y3'] or g['y4']
+        month = g['m1'] or g['m2'] or g['m3'] or g['m4']
+        day = g['d1'] or g['d2'] or g['d3'] or g['d4']
+        return datetime(int(year), int(month), int(day))
+
+
+_TS_ATTRS = '__ts__', '__timestamp__', '__date__', '__datetime__'
+
+
+def _is_iso(item: str) -> bool:
+    try:
+        datetime.fromisoformat(item)
+    except ValueError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=4096)
+def _parse_complete_str(item: str) -> datetime | None:
+    # cache only full dates since parse fills missing fields from today
+    if _DATE_RE.fullmatch(item) or _is_iso(item):
+        return parse(item)
+    return None
+
+
+def _parse_datetime_str(item: str) -> datetime:
+    return _parse_complete_str(item) or parse(item)
+
+
+def _float_str(item: float) -> str:
+    # read float as date.time
+    dt, tm = str(item).split('.')
+    tm = tm.ljust(6, '0')
+    return f"{dt[0:4]}-{dt[4:6]}-{dt[6:8]} {tm[0:2]}:{tm[2:4]}:{tm[4:6]}"
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _parse_datetime_number(item: int | float) -> datetime:
+    if isinstance(item, float):
+        return _parse_datetime_str(_float_str(item))
+    return _parse_datetime_str(str(item))
 
 
 def parse_datetime(
@@ -45,29 +89,41 @@ def parse_datetime(
     # if isinstance(item, timedelta):
     #     return parse_datetime(default) + item
 
+    # fast path for the most common types
+    if item.__class__ is datetime:
+        return item
+    if item.__class__ is str:
+        return _parse_datetime_str(item)
+    if item.__class__ is int or item.__class__ is float:
+        # only full yyyymmdd numbers (shorter ones depend on today)
+        if 10_000_000 <= item < 100_000_000:
+            return _parse_datetime_number(item)
+
     # use date construction attribute from item
-    if hasattr(item, '__ts__'):
-        item = item.__ts__
-        item = item() if callable(item) else item
-    elif hasattr(item, '__timestamp__'):
-        item = item.__timestamp__
-        item = item() if callable(item) else item
-    elif hasattr(item, '__date__'):
-        item = item.__date__
-        item = item() if callable(item) else item
-    elif hasattr(item, '__datetime__'):
-        item = item.__datetime__
-        item = item() if callable(item) else item
+    for attr in _TS_ATTRS:
+        func = getattr(item, attr, None)
+        if func is not None:
+            item = func() if callable(func) else func
+            break
 
     # read float as date.time
     if isinstance(item, float):
-        dt, tm = str(item).split('.')
-        tm = tm.ljust(6, '0')
-        item = f"{dt[0:4]}-{dt[4:6]}-{dt[6:8]} {tm[0:2]}:{tm[2:4]}:{tm[4:6]}"
+        item = _float_str(item)
+
+    # read date or datetime (subclass) fields directly
+    if isinstance(item, datetime):
+        return datetime(item.year, item.month, item.day,
+                        item.hour, item.minute, item.second,
+                        item.microsecond, item.tzinfo, fold=item.fold)
+    if isinstance(item, date):
+        return datetime(item.year, item.month, item.day)
 
     # gather year, month and day from item
-    if all(hasattr(item, a) for a in ('year', 'month', 'day')):
+    try:
         year, month, day = item.year, item.month, item.day
+    except AttributeError:
+        pass
+    else:
         hour = getattr(item, 'hour', 0)
         minute = getattr(item, 'minute', 0)
         second = getattr(item, 'second', 0)
@@ -78,7 +134,46 @@ def parse_datetime(
                         microsecond, tzinfo, fold=fold)
 
     # parse datetime from string
-    return parse(str(item))
+    return _parse_datetime_str(str(item))
+
+
+_SEPARATORS = str.maketrans('', '', '_,' + whitespace)
+_UNITS = {
+    'years': 'y', 'year': 'y', 'y': 'y',
+    'quarters': 'q', 'quarter': 'q', 'q': 'q',
+    'months': 'm', 'month': 'm', 'm': 'm',
+    'weeks': 'w', 'week': 'w', 'w': 'w',
+    'days': 'd', 'day': 'd', 'd': 'd',
+    'hours': 'h', 'hour': 'h', 'h': 'h',
+    'minutes': 'i', 'minute': 'i', 'min': 'i', 'i': 'i',
+    'microseconds': 'μ', 'microsecond': 'μ', 'µs': 'μ', 'μs': 'μ', 'μ': 'μ',
+    'seconds': 's', 'second': 's', 'sec': 's', 's': 's',
+}
+_UNIT_RE = re.compile(
+    r'([+-]?(?:\d+(?:\.\d*)?|\.\d+))(' +
+    '|'.join(sorted(map(re.escape, _UNITS), key=len, reverse=True)) + ')'
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_timedelta_str(item: str) -> tuple:
+    # can even parse strings
+    # like '-2Y-4Q+5M' but also '0B', '-1Y2M3D' as well.
+    item = item.lower().replace('and', '').translate(_SEPARATORS)
+    acc = dict.fromkeys('yqmwdhisμ', 0.)
+    pos = 0
+    for match in _UNIT_RE.finditer(item):
+        if match.start() != pos:
+            break
+        num, unit = match.groups()
+        acc[_UNITS[unit]] += float(num)
+        pos = match.end()
+    if pos != len(item):
+        raise ValueError(f"Unable to parse {item[pos:]!r} in {item!r}")
+    months = acc['m'] + 3 * acc['q'] + 12 * acc['y']
+    days = acc['d'] + 7 * acc['w']
+    seconds = (acc['h'] * 60 + acc['i']) * 60 + acc['s']
+    return days, seconds, acc['μ'], months
 
 
 def parse_timedelta(
@@ -104,58 +199,17 @@ def parse_timedelta(
     >>> parse_timedelta('2h4i8s')
     datetime.timedelta(seconds=7448)
 
+    >>> parse_timedelta('1 week and 2 days')
+    datetime.timedelta(days=9)
+
     >>> with_months = lambda *_, months=0: print(timedelta(*_), months)
     >>> parse_timedelta('1y 3quarters 1m', with_months=with_months)
     0:00:00 22.0
 
     """
-    # can even parse strings
-    # like '-2Y-4Q+5M' but also '0B', '-1Y2M3D' as well.
-    item = item.lower()
-    item = item.replace('and', '')
-    item = item.replace('_', '')
-    item = item.replace(',', '')
-    item = item.replace(' ', '')
-    item = item.replace('years', 'y')
-    item = item.replace('quarters', 'q')
-    item = item.replace('months', 'm')
-    item = item.replace('weeks', 'w')
-    item = item.replace('days', 'd')
-    item = item.replace('hours', 'h')
-    item = item.replace('minutes', 'i')
-    item = item.replace('min', 'i')
-    item = item.replace('seconds', 's')
-    item = item.replace('sec', 's')
-    item = item.replace('microseconds', 'μ')
-    item = item.replace('µs', 'μ')
-    item = item.replace('μs', 'μ')
-
-    def _parse(p, letter):
-        if p.find(letter) >= 0:
-            s, p = p.split(letter, 1)
-            s = s[1:] if s.startswith('+') else s
-            sgn, s = (-1, s[1:]) if s.startswith('-') else (1, s)
-            if not s.replace(".", "").isdigit():
-                raise ValueError(f"Unable to parse {s} in {p}")
-            return sgn * float(s), p
-        return 0, p
-
-    y, p = _parse(item, 'y')
-    q, p = _parse(p, 'q')
-    m, p = _parse(p, 'm')
-    w, p = _parse(p, 'w')
-    d, p = _parse(p, 'd')
-    h, p = _parse(p, 'h')
-    i, p = _parse(p, 'i')
-    s, p = _parse(p, 's')
-    mu, p = _parse(p, 'μ')
-    if p:
-        raise ValueError(f"Unable to parse {p!r}")
-    m = float(m) + 3 * float(q) + 12 * float(y)
-    d = float(d) + 7 * float(w)
-    s = (float(h) * 60 + float(i)) * 60 + float(s)
+    d, s, mu, m = _parse_timedelta_str(item)
     if m:
         if not with_months:
             raise ValueError(f"found {m} months")
-        return with_months(float(d), s, float(mu), months=m)
-    return timedelta(float(d), s, float(mu))
+        return with_months(d, s, mu, months=m)
+    return timedelta(d, s, mu)
@@ -1,6 +1,5 @@
 
 import os
-import itertools
 
 from pathlib import Path
 
@@ -10,37 +9,63 @@ from .parser import parse_datetime
 
 def gap(iterable, pp=True):
     iterable = sorted(iterable)
-    d = {ts: parse_datetime(prev) - parse_datetime(ts)
-         for ts, prev in zip(iterable, iterable[1:])}
-    d = dict(sorted(d.items(), key=lambda x: x[1]))
-    g_date, g_ts = tuple(d.items())[-1] if d else ('', 0)
+    g_date, g_ts = '', 0
+    if 1 < len(iterable):
+        parsed = [parse_datetime(ts) for ts in iterable]
+        g_date, g_ts = iterable[0], parsed[1] - parsed[0]
+        for i in range(1, len(parsed) - 1):
+            d = parsed[i + 1] - parsed[i]
+            if g_ts <= d:
+                g_date, g_ts = iterable[i], d
     if pp:
         return f"missing {g_ts}, at most on {g_date}"
     return g_date, g_ts
 
 
 def minmax(iterable, pp=True):
-    min_, max_ = min(iterable), max(iterable)
+    iterator = iter(iterable)
+    min_ = max_ = next(iterator, None)
+    if min_ is None:
+        raise ValueError("minmax() arg is an empty iterable")
+    for item in iterator:
+        if item < min_:
+            min_ = item
+        elif max_ < item:
+            max_ = item
     if pp:
         return f"{min_} ... {max_}"
     return min_, max_
 
 
+_BRACKETS = '[]', '()', '||', '{}', '<>', '**', '::'
+
+
 def _brackets(iterable, sep=' '):
-    brackets = '[]', '()', '||', '{}', '<>', '**', '::'
-    return sep.join(s + str(i) + e for s, e, i
-                    in zip(itertools.cycle(brackets), iterable))
+    n = len(_BRACKETS)
+    return sep.join(_BRACKETS[i % n][0] + str(v) + _BRACKETS[i % n][1]
+                    for i, v in enumerate(iterable))
 
 
 def _join(iterable, sep='] [', start='[', stop=']'):
     return f"{start}{sep.join(iterable)}{stop}"
 
 
-def _summary(dir_path: Path, *func):
+def _scandir(dir_path: Path | str):
+    dirs, files = [], []
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir():
+                dirs.append(entry)
+            else:
+                files.append(entry.name)
+    return dirs, files
+
+
+def _summary(items, *func):
     if not func:
         func = minmax, len
-    items = [d.name for d in dir_path.iterdir()
-             if not d.is_dir() and not d.name.startswith('.')]
     if not items:
         return ''
     if func:
@@ -49,35 +74,47 @@ def _summary(dir_path: Path, *func):
     return f" [{minmax(items)}] ({len(items)})"
 
 
-def _iter(dir_path: Path, *func, prefix='', level=-1):
+def _iter(contents, *func, prefix='', level=-1):
     space = '   '
     branch = '│  '
     tee = '├─ '
     last = '└─ '
 
+    def children(contents):
+        contents = sorted((entry.name, entry) for entry in contents)
+        max_name = max((len(name) for name, _ in contents), default=0)
+        pointers = [tee] * (len(contents) - 1) + [last]
+        return iter([(pointer, name.upper().ljust(max_name), entry)
+                     for pointer, (name, entry) in zip(pointers, contents)])
+
     if level == 0:
         return  # stop iterating
-    contents = [d for d in dir_path.iterdir()
-                if d.is_dir() and not d.name.startswith('.')]
-    contents.sort(key=lambda x: x.name)
-    max_name = max([len(d.name) for d in contents], default=0)
-    pointers = [tee] * (len(contents) - 1) + [last]
-    for pointer, path in zip(pointers, contents):
-        yield (prefix + pointer + path.name.upper().ljust(max_name) +
-               _summary(path, *func))
-        extension = branch if pointer == tee else space
-        yield from _iter(path, *func,
-                         prefix=prefix + extension, level=level - 1)
+    # depth first traversal with an explicit stack of sibling iterators
+    stack = [(children(contents), prefix, level)]
+    while stack:
+        siblings, prefix, level = stack[-1]
+        item = next(siblings, None)
+        if item is None:
+            stack.pop()
+            continue
+        pointer, name, entry = item
+        dirs, files = _scandir(entry.path)
+        yield prefix + pointer + name + _summary(files, *func)
+        if level != 1:
+            extension = branch if pointer == tee else space
+            stack.append((children(dirs), prefix + extension, level - 1))
 
 
 def tree(dir_path: Path, *func, limit=1000):
     """prints a visual tree structure of the directory"""
-    func = tuple(func)
+    func, limit = tuple(func), int(limit)
     if dir_path.exists():
-        s = [dir_path.name.upper() + _summary(dir_path, *func)]
-        iterator = _iter(dir_path, *func)
-        s += list(itertools.islice(iterator, limit))
-        if next(iterator, None):
-            s.append(f'... length_limit, {limit}, reached')
+        dirs, files = _scandir(dir_path)
+        s = [dir_path.name.upper() + _summary(files, *func)]
+        for count, line in enumerate(_iter(dirs, *func)):
+            if count == limit:
+                s.append(f'... length_limit, {limit}, reached')
+                break
+            s.append(line)
         return os.linesep.join(s)
     return ''
@@ -17,10 +17,14 @@ from .parser import parse_datetime
 from .tsdiff import TSDiff
 from .tslist import TSList
 
+_DATE_FMT = "%04d%02d%02d"
+_DATETIME_FMT = "%04d%02d%02d.%02d%02d%02d"
+
 
 class TS(datetime):
     __slots__ = ('_year', '_month', '_day', '_hour', '_minute', '_second',
-                 '_microsecond', '_tzinfo', '_hashcode', '_fold')
+                 '_microsecond', '_tzinfo', '_hashcode', '_fold',
+                 '_float_cache')
 
     _WARN = False
     DEFAULT = None
@@ -75,13 +79,23 @@ class TS(datetime):
         >>> TS(datetime(2020, 10, 13, 1, 23, 45))
         TS(20201013.012345)
 
+        >>> TS(date(2020, 10, 13))
+        TS(20201013)
+
         """
         if cls._WARN:
             cls._WARN = False
             warn("TS implementation is still experimental")
 
-        other = month, day, hour, minute, second, microsecond, tzinfo, fold
-        if not any(other):
+        if not (month or day or hour or minute or second or microsecond
+                or tzinfo or fold):
+            if isinstance(year, datetime):
+                return super().__new__(cls, year.year, year.month, year.day,
+                                       year.hour, year.minute, year.second,
+                                       year.microsecond, year.tzinfo,
+                                       fold=year.fold)
+            if isinstance(year, date):
+                return super().__new__(cls, year.year, year.month, year.day)
             item = parse_datetime(year, cls.DEFAULT)
             year, month, day = item.year, item.month, item.day
             hour = getattr(item, 'hour', 0)
@@ -101,24 +115,26 @@ class TS(datetime):
 
     def __repr__(self):
         cls = self.__class__.__name__
-        year, month, day = self.year, self.month, self.day
-        hour, minute, second = self.hour, self.minute, self.second
-        microsecond, tzinfo, fold = self.microsecond, self.tzinfo, self.fold
-        if microsecond or tzinfo or fold:
+        if self.microsecond or self.tzinfo or self.fold:
             return f"{cls}({str(self)!r})"
-        d = f"{year:04}{month:02}{day:02}"
-        if hour or minute or second:
-            return f"{cls}({d}.{hour:02}{minute:02}{second:02})"
-        return f"{cls}({d})"
+        y, mo, d = self.year, self.month, self.day
+        h, mi, s = self.hour, self.minute, self.second
+        if h or mi or s:
+            return f"{cls}({_DATETIME_FMT % (y, mo, d, h, mi, s)})"
+        return f"{cls}({_DATE_FMT % (y, mo, d)})"
 
     def __float__(self):
-        year, month, day = self.year, self.month, self.day
-        hour, minute, second = self.hour, self.minute, self.second
-        d = f"{year:04}{month:02}{day:02}.{hour:02}{minute:02}{second:02}"
-        return float(d)
+        try:
+            return self._float_cache
+        except AttributeError:
+            pass
+        y, mo, d = self.year, self.month, self.day
+        h, mi, s = self.hour, self.minute, self.second
+        self._float_cache = float(_DATETIME_FMT % (y, mo, d, h, mi, s))
+        return self._float_cache
 
     def __int__(self):
-        return int(float(self))
+        return (self.year * 100 + self.month) * 100 + self.day
 
     def __copy__(self):
         return self.__class__(self)
@@ -1,13 +1,39 @@
 
 import sys
-from urllib.parse import quote_plus
+from concurrent.futures import ThreadPoolExecutor
+from threading import local
 
+try:
+    from simdjson import Parser
+except ImportError:
+    Parser = None
 
 from tslist import TSDict
 
+_PARSERS = local()  # simdjson parsers must not be shared between threads
+_SESSIONS = {}
+
+
+def _json(response):
+    """decode json response (using simdjson if available)"""
+    if Parser is None:
+        return response.json()
+    parser = getattr(_PARSERS, 'parser', None)
+    if parser is None:
+        parser = _PARSERS.parser = Parser()
+    # recursive parsing returns plain python objects, so the parser
+    # (and its internal buffer) can be reused for the next response
+    try:
+        return parser.parse(response.content, recursive=True)
+    except ValueError:
+        # e.g. NaN or big integers which simdjson rejects
+        return response.json()
+
 
 class TSClient:
     TIMEOUT = 30
+    POOL_CONNECTIONS = 8
+    POOL_MAXSIZE = 32
 
     def __init__(self, path='', *, verbose=1, token='',
                  host='127.0.0.1', port='5000'):
@@ -90,18 +116,39 @@ class TSClient:
         if self.cc:
             self.cc(self.path).update(iterable)
 
+    @property
+    def session(self):
+        """`requests.Session` with keep-alive connection pool
+        (shared by all clients of the same host and port)"""
+        key = self.host, self.port
+        if key not in _SESSIONS:
+            try:
+                import requests
+            except ImportError:
+                raise ImportError("'client' requires 'requests' to be "
+                                  "installed. Consider 'pip install requests'")
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=self.POOL_CONNECTIONS,
+                pool_maxsize=self.POOL_MAXSIZE)
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _SESSIONS[key] = session
+        return _SESSIONS[key]
+
+    def close(self):
+        """closes the connections of the shared session"""
+        session = _SESSIONS.pop((self.host, self.port), None)
+        if session is not None:
+            session.close()
+
     def _get(self, *args, **kwargs):
-        try:
-            import requests
-        except ImportError:
-            raise ImportError("'client' requires 'requests' to be installed. "
-                              "Consider 'pip install requests'")
-        kwargs = {k: v if isinstance(v, int) else quote_plus(v)
-                  for k, v in kwargs.items() if v is not None}
+        # requests url-encodes query parameters itself
+        kwargs = {k: v for k, v in kwargs.items() if v is not None}
         if self.token:
             kwargs['token'] = kwargs.get('token', self.token)
         url = self.url.replace(' ', '+') + "/" + "/".join(args)
-        result = requests.get(url, params=kwargs, timeout=self.TIMEOUT)
+        result = self.session.get(url, params=kwargs, timeout=self.TIMEOUT)
         if result.status_code != 200:
             self._warn(f"{result.reason} [{result.status_code}]", result.url)
         return result
@@ -110,12 +157,12 @@ class TSClient:
         if isinstance(item, slice):
             result = self._get(start=item.start, stop=item.stop,
                                step=item.step)
-            items = TSDict(result.json().items())
+            items = TSDict(_json(result).items())
             self._update(items)
             return items
         # if isinstance(item, int):
         #     return self[::][item]
-        items = self._get(item=item).json()
+        items = _json(self._get(item=item))
         self._update({item: items})
         return items
 
@@ -159,9 +206,26 @@ class TSClient:
         return self.__class__(**kwargs)
 
     def subdir(self, **kwargs):
-        args = list(d for d in self._get('subdir').json())
+        args = list(d for d in _json(self._get('subdir')))
         return tuple(self(arg, **kwargs) for arg in args)
 
+    def prefetch(self, max_workers=16, **kwargs):
+        """fetches items of all subdirectories concurrently
+
+        :param max_workers: max number of concurrent requests
+        :param kwargs: arguments passed to |TSClient.subdir()|
+        :return: dict of subdirectory names and their items
+
+        Requests are sent from a thread pool over the shared
+        keep-alive session. Results are cached like single requests.
+        """
+        subdirs = self.subdir(**kwargs)
+        for sub in subdirs:
+            sub.cc = self.cc
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            items = executor.map(lambda sub: sub[::], subdirs)
+            return dict(zip((sub.name for sub in subdirs), items))
+
     def tree(self, print=print):
         s = self._get('tree').text
         return print(s) if print else s
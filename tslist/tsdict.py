@@ -10,6 +10,7 @@
 # License:  Apache License 2.0 (see LICENSE file)
 
 
+from itertools import islice
 from pprint import pformat
 
 from .tslist import TSList
@@ -105,30 +106,79 @@ class TSDict(dict):
 
         """  # noqa E501
         super().__init__(iterable, **kwargs)
+        self._keys = None
+
+    def _tskeys(self):
+        # cached TSList of keys (reset on any change of keys)
+        keys = getattr(self, '_keys', None)
+        if keys is None:
+            keys = self._keys = TSList(self.keys())
+        return keys
 
     def _getitem(self, key):
         return super().__getitem__(key)
 
     def __getitem__(self, key):
         if isinstance(key, int):
-            key = tuple(self.keys())[key]
+            n = len(self)
+            if not -n <= key < n:
+                cls = self.__class__.__name__
+                raise IndexError(f"{cls} index out of range")
+            return self._getitem(next(islice(self, key % n, None)))
+
+        if not isinstance(key, slice):
+            try:
+                return self._getitem(key)
+            except (KeyError, TypeError):
+                pass  # filter keys equal to key
+
+        keys = self._tskeys()
+        return self.__class__((k, self._getitem(k)) for k in keys[key])
+
+    def __setitem__(self, key, value):
+        self._keys = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._keys = None
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self._keys = None
+        return super().__ior__(other)
+
+    def update(self, *args, **kwargs):
+        self._keys = None
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key, default=None):
+        self._keys = None
+        return super().setdefault(key, default)
+
+    def pop(self, *args):
+        self._keys = None
+        return super().pop(*args)
 
-        keys = TSList(self.keys())
-        if isinstance(key, slice) or key not in keys:
-            items = {k: self._getitem(k) for k in keys[key]}.items()
-            return self.__class__(items)
+    def popitem(self):
+        self._keys = None
+        return super().popitem()
 
-        return self._getitem(key)
+    def clear(self):
+        self._keys = None
+        super().clear()
 
     def __str__(self):
         return super().__str__()
 
     def __repr__(self):
         c = self.__class__.__name__
-        s = super().__repr__()
-        s = f"{c}({s})"
-        if len(s) < 80:
-            return s
+        # each item takes at least 6 chars, i.e. 'k: v, ',
+        # so large dicts never fit in one line
+        if 6 * len(self) + len(c) + 2 < 80:
+            s = super().__repr__()
+            s = f"{c}({s})"
+            if len(s) < 80:
+                return s
         s = pformat(dict(self), indent=2, sort_dicts=False)
         return f"{c}(\n{s}\n)"
 
@@ -10,26 +10,49 @@
 # License:  Apache License 2.0 (see LICENSE file)
 
 
+from calendar import isleap
 from datetime import date, datetime, timedelta
 from warnings import warn
 
 from .parser import parse_timedelta
 
 
+def _year_seconds(year: int):
+    return (366 if isleap(year) else 365) * 86400
+
+
+def _new_year(d: date, year: int):
+    if isinstance(d, datetime):
+        return datetime(year, 1, 1, tzinfo=d.tzinfo)
+    return date(year, 1, 1)
+
+
 def actact(start: date, end: date):
+    """actual/actual year fraction between **start** and **end**
+
+    >>> from datetime import datetime
+    >>> from tslist.tsdiff import actact
+
+    >>> actact(datetime(2020, 1, 1), datetime(2021, 1, 1))
+    1.0
+
+    >>> actact(datetime(2019, 7, 1), datetime(2021, 1, 1))  # 1 + 184 / 365
+    1.504109589041096
+    """
+    if end < start:
+        return -actact(end, start)
     s, e = start.year, end.year
-    if e - s == 0:
-        total = datetime(s, 12, 31) - datetime(s - 1, 12, 31)
-        return (end - start).total_seconds() / total.total_seconds()
+    if s == e:
+        return (end - start).total_seconds() / _year_seconds(s)
     yf = e - s - 1
-    start -= timedelta(1)  # since the first day counts
-    yf += actact(start - timedelta(1), datetime(s, 12, 31))
-    yf += actact(datetime(e, 1, 1), end)
+    yf += (_new_year(start, s + 1) - start).total_seconds() / _year_seconds(s)
+    yf += (end - _new_year(end, e)).total_seconds() / _year_seconds(e)
     return yf
 
 
 class TSDiff(timedelta):
-    __slots__ = '_days', '_seconds', '_microseconds', '_hashcode', 'origin'
+    __slots__ = ('_days', '_seconds', '_microseconds', '_hashcode', 'origin',
+                 '_str_cache')
 
     _WARN = False
 
@@ -108,6 +131,10 @@ class TSDiff(timedelta):
         return actact(self.origin, self.origin + self)
 
     def _str(self):
+        try:
+            return self._str_cache
+        except AttributeError:
+            pass
         s = ''
         if self.days > 0:
             s += f"{self.days}d"
@@ -117,6 +144,7 @@ class TSDiff(timedelta):
             s += f"{self.microseconds}μs"
         if self.days < 0:
             s += f"{self.days}d"
+        self._str_cache = s
         return s
 
     def __str__(self):
@@ -1,24 +1,198 @@
 
 import os
+import re
+import struct
 import sys
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from inspect import signature
-from json import loads, dumps
+from json import loads as _json_loads, dumps as _json_dumps
 from pathlib import Path
 from shutil import rmtree, move
+from threading import Lock
+from uuid import uuid4
+
+try:
+    from orjson import dumps as _orjson_dumps, loads as _orjson_loads
+    from orjson import OPT_INDENT_2, OPT_NON_STR_KEYS, OPT_PASSTHROUGH_DATETIME
+    from orjson import JSONDecodeError
+except ImportError:
+    _orjson_dumps = None
+
+try:
+    from fcntl import flock, LOCK_EX
+except ImportError:
+    flock = None
 
 from .tslist import TSList
 from .tsdict import TSDict
 from .tree import tree
 
 
+_LONG_DIGITS = re.compile(rb'\d{19}')
+
+
+def _str_default(value):
+    # number subclasses (e.g. numpy floats) stay numbers with json
+    if isinstance(value, (int, float)):
+        raise TypeError(type(value))
+    return str(value)
+
+
+def dumps(value) -> bytes:
+    """json bytes of value (as written by json.dumps)"""
+    if _orjson_dumps is not None:
+        option = OPT_INDENT_2 | OPT_NON_STR_KEYS | OPT_PASSTHROUGH_DATETIME
+        try:
+            data = _orjson_dumps(value, default=_str_default, option=option)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bit
+        else:
+            # orjson writes nan and inf as null, json keeps them
+            if b'null' not in data:
+                return data
+    return _json_dumps(value, indent=2, default=str).encode()
+
+
+def loads(data: bytes):
+    """object from json bytes (including NaN and Infinity)"""
+    # orjson reads integers beyond 64 bit as float, json keeps them
+    if _orjson_dumps is not None and not _LONG_DIGITS.search(data):
+        try:
+            return _orjson_loads(data)
+        except JSONDecodeError:
+            pass
+    return _json_loads(data)
+
+
 NOW = None
 _NO_WRITER = 'this is a read-only access'
+_LOG_NAME = '.ts.log'  # inner dot, so no hidden attribute file name
+_RECORD = struct.Struct('<HI')  # key and value length of log records
 
 logger = print
 
 
+@lru_cache(maxsize=None)
+def _init_parameters(cls):
+    """names of |TSDir| (subclass) init arguments (without 'self')"""
+    return tuple(signature(cls.__init__).parameters)[1:]
+
+
+@lru_cache(maxsize=None)
+def _executor(max_workers):
+    """thread pool shared by all |TSDir| reads (threads start on demand)"""
+    return ThreadPoolExecutor(max_workers=max_workers,
+                              thread_name_prefix='TSDir')
+
+
+def _write_fd(fd, data: bytes, sync=False):
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+    if sync:
+        os.fsync(fd)
+
+
+def _write(path, data: bytes, sync=False, mode=os.O_TRUNC):
+    """write bytes with a single open/write/close (and optional fsync)"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | mode, 0o666)
+    try:
+        _write_fd(fd, data, sync)
+    finally:
+        os.close(fd)
+
+
+class _FileCache:
+
+    def __init__(self, max_bytes):
+        """bytes of recently read files (shared by all |TSDir| instances)"""
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()  # path -> (stat stamp, bytes)
+        self._bytes = 0
+        self._lock = Lock()
+
+    def get(self, path, stamp):
+        with self._lock:
+            cached = self._data.get(path)
+            if cached is None or cached[0] != stamp:
+                return None
+            self._data.move_to_end(path)
+            return cached[1]
+
+    def put(self, path, stamp, data):
+        if self.max_bytes < len(data):
+            return
+        with self._lock:
+            self._pop(path)
+            self._data[path] = stamp, data
+            self._bytes += len(data)
+            while self.max_bytes < self._bytes:
+                _, (_, old) = self._data.popitem(last=False)
+                self._bytes -= len(old)
+
+    def discard(self, path):
+        with self._lock:
+            self._pop(path)
+
+    def _pop(self, path):
+        cached = self._data.pop(path, None)
+        if cached is not None:
+            self._bytes -= len(cached[1])
+
+
+_FILE_CACHE = _FileCache(max_bytes=8 << 20)  # per process
+
+
+class _LazyValues(Sequence):
+
+    def __init__(self, tsdir, keys):
+        """lazy sequence of |TSDir| values (files are read on access)"""
+        self._tsdir = tsdir
+        self._keys = keys
+
+    def _read(self, key):
+        return self._tsdir._getitem(key)
+
+    def _read_all(self, keys):
+        return tuple(self._tsdir._read_many(keys))
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __iter__(self):
+        return map(self._read, self._keys)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._read_all(self._keys[index])
+        return self._read(self._keys[index])
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return self[:] == tuple(other)
+
+    def __repr__(self):
+        return repr(self[:])
+
+
+class _LazyItems(_LazyValues):
+
+    def _read(self, key):
+        return key, self._tsdir._getitem(key)
+
+    def _read_all(self, keys):
+        return tuple(zip(keys, self._tsdir._read_many(keys)))
+
+
 class TSDir:
+    MAX_WORKERS = 32
+    SYNC = False
 
     @classmethod
     def from_home(cls, path='', *, read_only=True, verbose=1, cwd=''):
@@ -91,6 +265,17 @@ class TSDir:
         >>> s2['2024-12-24']
         {'name': 'Christmas Eve'}
 
+        Only plain file names count as keys, paths do not
+
+        >>> '2024-12-24' in s2
+        True
+        >>> str(s2.path.absolute() / '2024-12-24') in s2
+        False
+        >>> 'SUBDIR2/2024-12-24' in d
+        False
+        >>> d['SUBDIR2/2024-12-24']
+        TSDict({})
+
         Get an overview of all dirs and items
 
         >>> d.tree()
@@ -119,6 +304,13 @@ class TSDir:
         TESTDIR2
         └─ SUBDIR2 [2024-12-24 ... 2024-12-31] [2]
 
+        Values like NaN or big integers are stored as by json
+
+        >>> s3 = d('SUBDIR3')
+        >>> s3['2024-12-24'] = {'value': float('nan'), 'big': 2 ** 70}
+        >>> s3['2024-12-24']
+        {'value': nan, 'big': 1180591620717411303424}
+
         Remove even the directory itself
 
         >>> d.remove()
@@ -137,6 +329,7 @@ class TSDir:
             raise OSError(f"{_.absolute()} not a directory")
 
         self._ = _
+        self._keys_cache = None  # (mtime, keys) of directory
         self.read_only = read_only
         self.verbose = verbose
 
@@ -159,20 +352,44 @@ class TSDir:
     # --- dict type attributes ---
 
     def __len__(self):
-        return len(self.keys())
+        return len(self._keys())
 
     def __iter__(self):
-        return iter(self.keys())
+        return iter(self._keys())
 
     def __contains__(self, item):
-        return item in self.keys()
+        if not isinstance(item, str) or item.startswith('.'):
+            return False
+        # only plain file names (no paths outside or below the directory)
+        if os.sep in item or (os.altsep and os.altsep in item):
+            return False
+        return self._.joinpath(item).is_file()
 
     def __bool__(self):
         if not self._.exists():
             return False
-        return bool(self.keys())
+        if self._keys_cache is not None:
+            return bool(self._keys())
+        # stop at first item instead of listing and sorting all
+        with os.scandir(self._) as it:
+            return any(f.is_file() and not f.name.startswith('.') for f in it)
 
     def __setitem__(self, key, value):
+        self._setitem(key, value, sync=self.SYNC)
+        if self.SYNC:
+            self._sync_dir()
+
+    def _sync_dir(self):
+        # make renames durable (directories can not be opened on windows)
+        if self.read_only or not hasattr(os, 'O_DIRECTORY'):
+            return
+        fd = os.open(self._, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _setitem(self, key, value, sync=False):
         if self.read_only:
             return self._warn(_NO_WRITER)
 
@@ -182,23 +399,64 @@ class TSDir:
         if key is NOW:
             key = datetime.now().replace(microsecond=0)
         if isinstance(key, int):
-            key = self.keys()[key]
+            key = self._keys()[key]
 
-        j = dumps(value, indent=2, default=str)
-        self._.joinpath(str(key)).write_text(j)
+        self._store(str(key), dumps(value), sync)
         self._log(f"added {self.name}[{key}] = {str(value)[:16]}")
 
+    def _store(self, name, data, sync=False):
+        # write to hidden temporary file and rename (atomic replace)
+        fn = self._.joinpath(name)
+        tmp = fn.with_name(f".{fn.name}.{uuid4().hex}.tmp")
+        try:
+            _write(tmp, data, sync, mode=os.O_EXCL)
+            os.replace(tmp, fn)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        self._keys_cache = None
+        self._uncache(name)
+
+    def _discard(self, name):
+        self._uncache(name)
+        try:
+            self._.joinpath(name).unlink()
+        except FileNotFoundError:
+            return False
+        self._keys_cache = None
+        return True
+
     def _getitem(self, key):
-        j = self._.joinpath(str(key)).read_text()
-        return loads(j)
+        return loads(self._read_bytes(str(key)))
+
+    def _read_bytes(self, name):
+        # file content is cached as long as the file is not replaced
+        path = self._.joinpath(name)
+        st = path.stat()
+        stamp = st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size
+        data = _FILE_CACHE.get(str(path), stamp)
+        if data is None:
+            data = path.read_bytes()
+            _FILE_CACHE.put(str(path), stamp, data)
+        return data
+
+    def _uncache(self, name):
+        _FILE_CACHE.discard(str(self._.joinpath(name)))
+
+    def _read_many(self, keys):
+        # read files concurrently (file i/o releases the GIL)
+        keys = tuple(keys)
+        if len(keys) < 2:
+            return [self._getitem(k) for k in keys]
+        return list(_executor(self.MAX_WORKERS).map(self._getitem, keys))
 
     def __getitem__(self, key):
         if isinstance(key, int):
-            key = tuple(self.keys())[key]
+            key = self._keys()[key]
 
-        keys = self.keys()
-        if isinstance(key, slice) or key not in keys:
-            return TSDict({k: self._getitem(k) for k in keys[key]}.items())
+        if isinstance(key, slice) or key not in self:
+            keys = self._filter_keys(key)
+            return TSDict(zip(keys, self._read_many(keys)))
 
         return self._getitem(key)
 
@@ -206,30 +464,49 @@ class TSDir:
         if self.read_only:
             return self._warn(_NO_WRITER)
         if isinstance(key, slice):
-            for k in self.keys()[key]:
+            for k in self._filter_keys(key):
                 del self[k]
             return
         if isinstance(key, int):
-            key = self.keys()[key]
+            key = self._keys()[key]
 
-        fn = self._.joinpath(str(key)).absolute()
-        if os.path.exists(fn):
-            os.remove(fn)
+        if self._discard(str(key)):
             self._log(f"removed {self.name}[{key}]")
 
+    def _filter_keys(self, key):
+        keys = self._keys()
+        if not isinstance(key, slice):
+            return keys[key]
+        bounds = key.start, key.stop
+        str_bounds = all(b is None or isinstance(b, str) for b in bounds)
+        if str_bounds and (key.step is None or isinstance(key.step, int)):
+            # keys are sorted strings, so bisect str slice bounds
+            lo = bisect_left(keys, key.start) if key.start else 0
+            hi = bisect_left(keys, key.stop) if key.stop else len(keys)
+            return keys[lo:hi][::key.step]
+        return keys[key]
+
+    def _keys(self):
+        # sorted keys shared with the cache (must not be modified)
+        mtime = self._.stat().st_mtime_ns
+        if self._keys_cache is None or self._keys_cache[0] != mtime:
+            with os.scandir(self._) as it:
+                files = [f.name for f in it
+                         if f.is_file() and not f.name.startswith('.')]
+            self._keys_cache = mtime, TSList(sorted(files))
+        return self._keys_cache[1]
+
     def keys(self):
         """(see `dict.keys <https://docs.python.org/3/library/stdtypes.html#dict.keys>`_)"""  # noqa E501
-        files = (f.name for f in self._.iterdir()
-                 if f.is_file() and not f.name.startswith('.'))
-        return TSList(sorted(files))
+        return TSList(self._keys())
 
     def values(self):
         """(see `dict.values <https://docs.python.org/3/library/stdtypes.html#dict.values>`_)"""  # noqa E501
-        return tuple(self[k] for k in self)
+        return _LazyValues(self, self._keys())
 
     def items(self):
         """(see `dict.items <https://docs.python.org/3/library/stdtypes.html#dict.items>`_)"""  # noqa E501
-        return tuple((k, self[k]) for k in self)
+        return _LazyItems(self, self._keys())
 
     def update(self, iterable=(), **kwargs):
         """(see `dict.update <https://docs.python.org/3/library/stdtypes.html#dict.update>`_)"""  # noqa E501
@@ -237,23 +514,34 @@ class TSDir:
             raise ValueError('Only one of `iterable` and `kwargs` is allowed')
         kwargs.update(iterable)
         for k, v in kwargs.items():
-            self[k] = v
+            self._setitem(k, v, sync=self.SYNC)
+        if self.SYNC and kwargs:
+            # flush directory once for all renames
+            self._sync_dir()
+
+    def _pop(self, key):
+        if isinstance(key, int):
+            key = self._keys()[key]
+        if str(key) not in self:
+            raise KeyError(key)
+        try:
+            item = self._getitem(str(key))
+        except FileNotFoundError:
+            raise KeyError(key) from None
+        if self.read_only:
+            self._warn(_NO_WRITER)
+            return key, item
+        self._discard(str(key))
+        self._log(f"removed {self.name}[{key}]")
+        return key, item
 
     def pop(self, key):
         """(see `dict.pop <https://docs.python.org/3/library/stdtypes.html#dict.pop>`_)"""  # noqa E501
-        if isinstance(key, int):
-            key = self.keys()[key]
-        item = self[key]
-        del self[key]
-        return item
+        return self._pop(key)[1]
 
     def popitem(self, key):
         """(see `dict.popitem <https://docs.python.org/3/library/stdtypes.html#dict.popitem>`_)"""  # noqa E501
-        if isinstance(key, int):
-            key = self.keys()[key]
-        item = key, self[key]
-        del self[key]
-        return item
+        return self._pop(key)
 
     def setdefault(self, key, default=None):
         """(see `dict.setdefault <https://docs.python.org/3/library/stdtypes.html#dict.setdefault>`_)"""  # noqa E501
@@ -277,7 +565,7 @@ class TSDir:
         return f"{cls}({str(self.path)!r})"
 
     def __call__(self, path=None, **kwargs):
-        kw = {k: getattr(self, k) for k in signature(self.__init__).parameters}
+        kw = {k: getattr(self, k) for k in _init_parameters(type(self))}
         kw.update(kwargs)
         kw.pop('path', None)
         return self.__class__(self._.joinpath(str(path)), **kw)
@@ -288,7 +576,7 @@ class TSDir:
         return self._getitem('.' + item)
 
     def __setattr__(self, key, value):
-        slots = tuple(signature(self.__init__).parameters)
+        slots = _init_parameters(type(self))
         if key.startswith('_') or key in slots:
             super().__setattr__(key, value)
         else:
@@ -301,8 +589,9 @@ class TSDir:
 
     def subdir(self, **kwargs):
         """opens subdirectory (and may create it)"""
-        args = (d.name for d in self._.iterdir()
-                if d.is_dir() and not d.name.startswith('.'))
+        with os.scandir(self._) as it:
+            args = [d.name for d in it
+                    if d.is_dir() and not d.name.startswith('.')]
         return tuple(self(arg, **kwargs) for arg in args)
 
     def move(self, target):
@@ -310,7 +599,8 @@ class TSDir:
         if self.read_only:
             return self._warn(_NO_WRITER)
         try:
-            move(self._.absolute(), Path(target).absolute())
+            move(self._, Path(target))
+            self._keys_cache = None
             self._log(f"moved {self.name} to {target}")
         except OSError as e:
             return self._warn(str(e))
@@ -322,7 +612,8 @@ class TSDir:
         if self.read_only:
             return self._warn(_NO_WRITER)
         try:
-            rmtree(self._.joinpath(str(path)).absolute())
+            rmtree(self._.joinpath(str(path)))
+            self._keys_cache = None
             self._log(f"removed {self.name}")
         except FileNotFoundError as e:
             return self._warn(str(e))
@@ -331,3 +622,197 @@ class TSDir:
         """prints a visual tree structure of the directory"""
         s = tree(self._, *func, limit=limit)
         return print(s) if print else s
+
+
+class TSLogDir(TSDir):
+
+    def __init__(self, path: Path | str = '', *,
+                 read_only=True, verbose=1, cwd=''):
+        """|TSDir| storing all items in a single append-only log file
+
+        :param path: root of directory
+        :param read_only: if **False** directory content may be
+            created, changed and removed
+            (optional; default is **True**)
+        :param verbose: set level of verbosity (see |TSDir|)
+        :param cwd: working directory
+
+        Instead of one file per key, items are appended as
+        length-prefixed records to a hidden log file.
+        Changed items are appended again and
+        removed items are marked by an empty record.
+        So reading many items needs a single file read.
+
+        >>> from tslist import TSLogDir
+
+        >>> d = TSLogDir('test/TESTLOGDIR', read_only=False)
+        >>> d['2024-12-25'] = {'name': '1st Christmas Day'}
+        >>> d['2024-12-26'] = {'name': '2nd Christmas Day'}
+        >>> d['2024-12-24'] = {'name': 'Christmas Eve'}
+        >>> d['2024-12-24'] = {'name': 'Holy Night'}
+
+        >>> d.keys()
+        TSList(['2024-12-24', '2024-12-25', '2024-12-26'])
+
+        >>> d['2024-12-24']
+        {'name': 'Holy Night'}
+
+        >>> del d['2024-12-25']
+        >>> d[:]
+        TSDict(
+        { '2024-12-24': {'name': 'Holy Night'},
+          '2024-12-26': {'name': '2nd Christmas Day'}}
+        )
+
+        Outdated records remain in the log until it gets compacted.
+
+        >>> d.compact()
+        >>> d.values()
+        ({'name': 'Holy Night'}, {'name': '2nd Christmas Day'})
+
+        >>> d.remove()
+
+        """
+        super().__init__(path, read_only=read_only, verbose=verbose, cwd=cwd)
+
+    @property
+    def _log_path(self):
+        return self._.joinpath(_LOG_NAME)
+
+    def _index(self, f=None):
+        # scan records appended since last call to the open log file f
+        # (cache is inode, offset, index and keys of the log file)
+        if f is None:
+            try:
+                with open(self._log_path, 'rb') as f:
+                    return self._index(f)
+            except FileNotFoundError:
+                self._keys_cache = None
+                return {}, TSList()
+        st = os.fstat(f.fileno())
+        ino, offset, index, keys = self._keys_cache or (None, 0, {}, None)
+        if ino != st.st_ino or st.st_size < offset:
+            # log has been replaced (compacted) meanwhile
+            offset, index, keys = 0, {}, None
+        if offset < st.st_size:
+            f.seek(offset)
+            data = f.read(st.st_size - offset)
+            index = dict(index)  # others may still iterate the old one
+            pos = 0
+            while pos + _RECORD.size <= len(data):
+                k, v = _RECORD.unpack_from(data, pos)
+                start = pos + _RECORD.size + k
+                if len(data) < start + v:
+                    break  # incomplete record
+                key = data[start - k:start].decode()
+                if v:
+                    index[key] = offset + start, v
+                else:
+                    index.pop(key, None)
+                pos = start + v
+            offset, keys = offset + pos, None
+        if keys is None:
+            keys = TSList(sorted(index))
+        self._keys_cache = st.st_ino, offset, index, keys
+        return index, keys
+
+    def _keys(self):
+        return self._index()[1]
+
+    def __contains__(self, item):
+        return isinstance(item, str) and item in self._index()[0]
+
+    def __bool__(self):
+        return self._.exists() and bool(self._index()[0])
+
+    def _getitem(self, key):
+        key = str(key)
+        if key.startswith('.'):
+            return super()._getitem(key)
+        try:
+            with open(self._log_path, 'rb') as f:
+                offset, length = self._index(f)[0][key]
+                f.seek(offset)
+                return loads(f.read(length))
+        except KeyError:
+            raise FileNotFoundError(key) from None
+
+    def _read_raw(self, keys, f=None):
+        # read the range covering all requested records at once
+        keys = tuple(keys)
+        if not keys:
+            return []
+        if f is None:
+            with open(self._log_path, 'rb') as f:
+                return self._read_raw(keys, f)
+        index = self._index(f)[0]
+        spans = [index[k] for k in keys]
+        lo = min(o for o, _ in spans)
+        hi = max(o + n for o, n in spans)
+        f.seek(lo)
+        data = f.read(hi - lo)
+        return [data[o - lo:o - lo + n] for o, n in spans]
+
+    def _read_many(self, keys):
+        return [loads(v) for v in self._read_raw(keys)]
+
+    def _store(self, name, data, sync=False):
+        if name.startswith('.'):
+            return super()._store(name, data, sync)
+        key = name.encode()
+        record = _RECORD.pack(len(key), len(data)) + key + data
+        fd = self._lock_log()
+        try:
+            _write_fd(fd, record, sync)
+        finally:
+            os.close(fd)
+
+    def _lock_log(self):
+        # open current log file for appending, exclusively locked
+        # (appends and compaction do not interleave between processes)
+        while True:
+            fd = os.open(self._log_path,
+                         os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o666)
+            if flock is None:
+                return fd
+            flock(fd, LOCK_EX)
+            if os.fstat(fd).st_ino == os.stat(self._log_path).st_ino:
+                return fd
+            os.close(fd)  # compacted meanwhile, so lock the new log
+
+    def _discard(self, name):
+        if name.startswith('.'):
+            return super()._discard(name)
+        if name not in self._index()[0]:
+            return False
+        self._store(name, b'')
+        return True
+
+    def compact(self):
+        """rewrites the log file dropping outdated records
+
+        Concurrent writers are locked out while compacting
+        (where `fcntl.flock` is available, otherwise
+        compaction requires exclusive access to the directory).
+        """
+        if self.read_only:
+            return self._warn(_NO_WRITER)
+        fd = self._lock_log()
+        try:
+            with open(fd, 'rb', closefd=False) as f:
+                keys = self._index(f)[1]
+                values = self._read_raw(keys, f)
+            records = b''.join(
+                _RECORD.pack(len(k), len(v)) + k + v
+                for k, v in zip((k.encode() for k in keys), values))
+            tmp = self._.joinpath(f"{_LOG_NAME}.{uuid4().hex}.tmp")
+            try:
+                _write(tmp, records, self.SYNC, mode=os.O_EXCL)
+                os.replace(tmp, self._log_path)
+            except BaseException:
+                tmp.unlink(missing_ok=True)
+                raise
+        finally:
+            os.close(fd)
+        self._keys_cache = None
+        self._log(f"compacted {self.name}")
@@ -10,27 +10,38 @@
 # License:  Apache License 2.0 (see LICENSE file)
 
 
+import re
+
 from datetime import datetime, date
+from functools import lru_cache
+from itertools import compress
 from pprint import pformat
-from typing import Callable, Any as DateType
+from typing import Callable
 
 from .parser import parse_datetime
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+_ISO = r'\d{4}-\d\d-\d\d(?:[T ]\d\d:\d\d(?::\d\d(?:\.\d{1,6})?)?)?'
+_ISO_LINES = re.compile(f"{_ISO}(?:\n{_ISO})*")
+
 
-class ts:
+def _parse_date(value):
+    return parse_datetime(value).date()
 
-    def __init__(self, cls: Callable | None = None,
-                 default: DateType | None = None):
-        """returns timestamp in given date type"""
-        self.cls = cls
-        self.default = default
 
-    def __call__(self, value: DateType | None = None):
-        if self.cls is None or self.cls == datetime:
-            return parse_datetime(value, self.default)
-        if self.cls == date:
-            return parse_datetime(value, self.default).date()
-        return self.cls(value)
+@lru_cache(maxsize=None)
+def _converter(cls: Callable | None = None):
+    """returns callable converting items to timestamps of given type"""
+    if cls is None or cls is datetime:
+        return parse_datetime
+    if cls is date:
+        return _parse_date
+    return cls
 
 
 class TSList(list):
@@ -117,28 +128,23 @@ class TSList(list):
             return super().__getitem__(key)
 
         if isinstance(key, tuple):
-            return tuple(super().__getitem__(k) for k in key)
+            return tuple(map(super().__getitem__, key))
 
         cls = self.__class__
         if not isinstance(key, slice):
-            t = ts(key.__class__)
+            t = _converter(key.__class__)
             return cls(v for v in self if t(v) == key)
 
         if isinstance(key.start, int) or isinstance(key.stop, int):
             # use default slice behavior
             return cls(super().__getitem__(key))
 
-        if key.start and key.stop:
-            t_s, t_e = ts(key.start.__class__), ts(key.stop.__class__)
-            r = (v for v in self if key.start <= t_s(v) and t_e(v) < key.stop)
-        elif key.start:
-            t = ts(key.start.__class__)
-            r = (v for v in self if key.start <= t(v))
-        elif key.stop:
-            t = ts(key.stop.__class__)
-            r = (v for v in self if t(v) < key.stop)
+        if np is not None and self._is_float_slice(key):
+            r = self._float_filter(key)
+        elif np is not None and self._is_datetime_slice(key):
+            r = self._datetime_filter(key)
         else:
-            r = self
+            r = self._filter(key)
 
         if isinstance(key.step, int):
             # gives TSList[start:stop:step] := TSList[start:stop][::step]
@@ -151,6 +157,69 @@ class TSList(list):
 
         return cls(r)
 
+    def _filter(self, key):
+        if key.start and key.stop:
+            t_s = _converter(key.start.__class__)
+            t_e = _converter(key.stop.__class__)
+            if t_s is t_e:
+                return (v for v in self if key.start <= t_s(v) < key.stop)
+            return (v for v in self
+                    if key.start <= t_s(v) and t_e(v) < key.stop)
+        if key.start:
+            t = _converter(key.start.__class__)
+            return (v for v in self if key.start <= t(v))
+        if key.stop:
+            t = _converter(key.stop.__class__)
+            return (v for v in self if t(v) < key.stop)
+        return self
+
+    @staticmethod
+    def _is_float_slice(key):
+        bounds = [b for b in (key.start, key.stop) if b]
+        return bool(bounds) and all(isinstance(b, float) for b in bounds)
+
+    @staticmethod
+    def _is_datetime_slice(key):
+        bounds = [b for b in (key.start, key.stop) if b]
+        return bool(bounds) and all(isinstance(b, datetime) and
+                                    b.tzinfo is None for b in bounds)
+
+    def _float_filter(self, key):
+        # vectorized comparison for float bounds (requires numpy)
+        try:
+            values = np.asarray(self, dtype=float)
+        except (TypeError, ValueError):
+            return self._filter(key)
+        return self._mask(values, key.start or None, key.stop or None)
+
+    def _datetime_filter(self, key):
+        # vectorized parsing of plain iso strings (requires numpy)
+        try:
+            lines = '\n'.join(self)
+        except TypeError:
+            return self._filter(key)
+        if not _ISO_LINES.fullmatch(lines):
+            return self._filter(key)
+        lines = lines.split('\n')
+        if len(lines) != len(self):
+            # some item contains a line break itself
+            return self._filter(key)
+        try:
+            values = np.array(lines, dtype='datetime64[us]')
+        except ValueError:
+            return self._filter(key)
+        start = np.datetime64(key.start, 'us') if key.start else None
+        stop = np.datetime64(key.stop, 'us') if key.stop else None
+        return self._mask(values, start, stop)
+
+    def _mask(self, values, start, stop):
+        mask = np.ones(len(values), dtype=bool)
+        if start is not None:
+            mask &= start <= values
+        if stop is not None:
+            mask &= values < stop
+        return compress(self, mask)
+
     def __str__(self):
         return super().__str__()
 